@@ -1,26 +1,224 @@
 #!/usr/bin/env python3
-import argparse
+import errno
+import itertools
+import mmap
+import os
 from pathlib import Path
-import shutil
+import queue
+import signal
+import stat
 import sys
+import threading
 import time
-import json
-from typing import List, Dict
+from typing import Dict, Iterator, List
 
-def find_empty_files(path: Path, recursive: bool = True, ignore_hidden: bool = True):
-    empty_files = []
-    iterator = path.rglob("*") if recursive else path.iterdir()
-    for p in iterator:
-        if p.is_file():
-            if ignore_hidden and any(part.startswith(".") for part in p.parts):
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Opt-in io_uring backend for the serial scan (Linux, needs the `liburing` package).
+# Only imported when requested, so normal runs don't pay for the attempt.
+liburing = None
+if os.environ.get("FILE_CLEANER_IO_URING") == "1":
+    try:
+        import liburing
+    except ImportError:
+        pass
+_USE_URING = liburing is not None
+_URING_BATCH = 16384
+
+def _json_dumps(obj) -> bytes:
+    import json
+    return (json.dumps(obj, separators=(",", ":")) + "\n").encode()
+
+def _json_loads(data):
+    import json
+    return json.loads(data)
+
+# orjson rejects lone surrogates, which os.fsdecode produces for filenames that are
+# not valid UTF-8; such records go through stdlib json (it writes them as \udcXX escapes)
+if orjson is not None:
+    def _dumps(obj) -> bytes:
+        try:
+            return orjson.dumps(obj, option=orjson.OPT_APPEND_NEWLINE)
+        except orjson.JSONEncodeError:
+            return _json_dumps(obj)
+
+    def _loads(data):
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            return _json_loads(data)
+else:
+    _dumps = _json_dumps
+    _loads = _json_loads
+
+METADATA_FILE = "metadata.jsonl"
+LEGACY_METADATA_FILE = "metadata.json"  # whole-array format written by older versions
+_METADATA_FLUSH = 1000  # records buffered before appending to the metadata file
+
+def _scan_dir(dirpath: str, recursive: bool, ignore_hidden: bool):
+    """Scan one directory; return (subdirs to descend into, empty files found)."""
+    subdirs = []
+    empty = []
+    try:
+        it = os.scandir(dirpath)
+    except OSError:
+        return subdirs, empty
+    with it:
+        for e in it:
+            if ignore_hidden and e.name.startswith("."):
                 continue
             try:
-                if p.stat().st_size == 0:
-                    empty_files.append(p)
+                if e.is_dir(follow_symlinks=False):
+                    if recursive:
+                        subdirs.append(e.path)
+                elif e.is_file(follow_symlinks=False) and e.stat(follow_symlinks=False).st_size == 0:
+                    empty.append(e.path)
             except OSError:
                 pass
+    return subdirs, empty
+
+def _scan_parallel(root: Path, ignore_hidden: bool, workers: int = 8) -> Iterator[str]:
+    """
+    Walk root with a pool of worker threads pulling directories off a shared queue.
+    Each worker pushes newly found subdirectories back on and hands empty files to
+    the caller through a results queue; once no directory is queued or being
+    scanned, every worker is sent a stop sentinel.
+    """
+    q = queue.SimpleQueue()
+    results = queue.SimpleQueue()
+    lock = threading.Lock()
+    stop = threading.Event()
+    pending = [1]  # directories queued or in flight
+    q.put(os.path.abspath(root))
+
+    def worker():
+        while True:
+            dirpath = q.get()
+            if dirpath is None or stop.is_set():
+                return
+            subdirs, empty = _scan_dir(dirpath, True, ignore_hidden)
+            if empty:
+                results.put(empty)
+            with lock:
+                pending[0] += len(subdirs) - 1
+                done = pending[0] == 0
+            for d in subdirs:
+                q.put(d)
+            if done:
+                results.put(None)
+                for _ in range(workers):
+                    q.put(None)
+
+    threads = [threading.Thread(target=worker, daemon=True) for _ in range(workers)]
+    for t in threads:
+        t.start()
+    try:
+        while True:
+            empty = results.get()
+            if empty is None:
+                return
+            yield from empty
+    finally:
+        # Caller stopped early (--limit, Ctrl-C): wind the workers down
+        stop.set()
+        for _ in range(workers):
+            q.put(None)
+
+def _statx_batch(ring, cqe, stats, paths: List[str]) -> List[str]:
+    """Submit one STATX per path, wait for all of them and return the zero-sized ones."""
+    empty_files = []
+    for i, p in enumerate(paths):
+        sqe = liburing.io_uring_get_sqe(ring)
+        liburing.io_uring_prep_statx(sqe, stats[i], p, liburing.AT_SYMLINK_NOFOLLOW, liburing.STATX_SIZE)
+        liburing.io_uring_sqe_set_data64(sqe, i)
+    liburing.io_uring_submit_and_wait(ring, len(paths))
+    for _ in range(len(paths)):
+        liburing.io_uring_wait_cqe(ring, cqe)
+        c = cqe[0]
+        idx = liburing.io_uring_cqe_get_data64(c)
+        try:
+            c.res  # raises for a failed statx (file vanished, no permission...)
+            if stats[idx].size == 0:
+                empty_files.append(paths[idx])
+        except OSError:
+            pass
+        liburing.io_uring_cqe_seen(ring, c)
     return empty_files
 
+def _open_ring():
+    """
+    Set up the io_uring used by _iter_empty_files_uring, or return None if the kernel
+    refuses (seccomp, kernel.io_uring_disabled, RLIMIT_MEMLOCK...). On failure the
+    backend is switched off for the rest of the process so setup isn't retried.
+    """
+    global _USE_URING
+    ring = liburing.Ring()
+    try:
+        liburing.io_uring_queue_init(_URING_BATCH, ring)
+    except OSError:
+        _USE_URING = False
+        return None
+    return ring
+
+def _iter_empty_files_uring(ring, root: Path, recursive: bool = True, ignore_hidden: bool = True) -> Iterator[str]:
+    """
+    Same walk as the scandir path, but regular files are only collected during the
+    walk and their sizes are fetched with batched IORING_OP_STATX requests.
+    Takes ownership of ring (from _open_ring) and tears it down when done.
+    """
+    cqe = liburing.Cqe()
+    stats = [liburing.Statx() for _ in range(_URING_BATCH)]
+    pending = []
+    try:
+        stack = [os.path.abspath(root)]
+        while stack:
+            try:
+                it = os.scandir(stack.pop())
+            except OSError:
+                continue
+            with it:
+                for e in it:
+                    if ignore_hidden and e.name.startswith("."):
+                        continue
+                    try:
+                        if e.is_dir(follow_symlinks=False):
+                            if recursive:
+                                stack.append(e.path)
+                        elif e.is_file(follow_symlinks=False):
+                            pending.append(e.path)
+                    except OSError:
+                        continue
+                    if len(pending) == _URING_BATCH:
+                        yield from _statx_batch(ring, cqe, stats, pending)
+                        pending = []
+        if pending:
+            yield from _statx_batch(ring, cqe, stats, pending)
+    finally:
+        liburing.io_uring_queue_exit(ring)
+
+def iter_empty_files(path: Path, recursive: bool = True, ignore_hidden: bool = True, workers: int = 1) -> Iterator[str]:
+    """Yield the absolute paths (as str) of zero-byte regular files under path as they are found."""
+    # Falls through to the scandir walks below if io_uring can't be set up
+    ring = _open_ring() if _USE_URING else None
+    if ring is not None:
+        yield from _iter_empty_files_uring(ring, path, recursive, ignore_hidden)
+        return
+    if recursive and workers > 1:
+        yield from _scan_parallel(path, ignore_hidden, workers=workers)
+        return
+    stack = [os.path.abspath(path)]
+    while stack:
+        subdirs, empty = _scan_dir(stack.pop(), recursive, ignore_hidden)
+        stack.extend(subdirs)
+        yield from empty
+
+def find_empty_files(path: Path, recursive: bool = True, ignore_hidden: bool = True, workers: int = 1) -> List[str]:
+    """Return the absolute paths (as str) of all zero-byte regular files under path."""
+    return list(iter_empty_files(path, recursive, ignore_hidden, workers))
+
 def make_quarantine_dir(base: Path = None):
     t = time.strftime("%Y%m%d-%H%M%S")
     base = Path(base) if base else Path.cwd()
@@ -28,189 +226,349 @@ def make_quarantine_dir(base: Path = None):
     q.mkdir(parents=True, exist_ok=True)
     return q.resolve()
 
-def _unique_path_if_exists(path: Path) -> Path:
+def _unique_path_if_exists(path: str) -> str:
     """Return a non-existing path by appending _1, _2..."""
-    if not path.exists():
+    if not os.path.exists(path):
         return path
-    stem = path.stem
-    suffix = path.suffix
-    parent = path.parent
+    parent, name = os.path.split(path)
+    stem, suffix = os.path.splitext(name)
     counter = 1
     while True:
-        candidate = parent.joinpath(f"{stem}_{counter}{suffix}")
-        if not candidate.exists():
+        candidate = os.path.join(parent, f"{stem}_{counter}{suffix}")
+        if not os.path.exists(candidate):
             return candidate
         counter += 1
 
-def safe_move(src: Path, dst_dir: Path, preserve_structure: bool, target_root: Path, dry_run: bool=False):
+# Next free counter per (parent, stem, suffix), so repeated collisions don't re-probe taken names
+_counter_cache: Dict[tuple, int] = {}
+
+def _claim_unique_path(path: str) -> str:
     """
-    Move src to dst_dir. If preserve_structure True, recreate src's path relative to target_root.
-    Avoid name collisions by appending a counter suffix.
-    Returns final destination Path and metadata dict.
+    Like _unique_path_if_exists, but atomically creates the chosen name (O_CREAT|O_EXCL)
+    so it cannot be taken before the caller moves a file over it.
     """
-    if preserve_structure:
+    parent, name = os.path.split(path)
+    stem, suffix = os.path.splitext(name)
+    key = (parent, stem, suffix)
+    counter = _counter_cache.get(key, 0)
+    while True:
+        candidate = path if counter == 0 else os.path.join(parent, f"{stem}_{counter}{suffix}")
         try:
-            rel = src.relative_to(target_root)
-        except Exception:
-            rel = Path(src.name)
-        dest_path = dst_dir.joinpath(rel)
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
-    else:
-        dest_path = dst_dir.joinpath(src.name)
-        dest_path.parent.mkdir(parents=True, exist_ok=True)
+            fd = os.open(candidate, os.O_CREAT | os.O_EXCL | os.O_WRONLY, 0o600)
+        except FileExistsError:
+            counter += 1
+            continue
+        os.close(fd)
+        _counter_cache[key] = counter + 1
+        return candidate
 
-    final_dest = _unique_path_if_exists(dest_path)
+def _copy_data(sfd: int, dfd: int, size: int) -> int:
+    """
+    Copy size bytes between file descriptors, in-kernel where possible.
+    Returns the number of bytes that could not be copied (0 on success).
+    """
+    remaining = size
+    # copy_file_range/sendfile may copy less than asked and fd offsets advance as
+    # they go; a 0 return means this method can't handle the pair, so try the next
+    methods = []
+    if hasattr(os, "copy_file_range"):
+        methods.append(lambda n: os.copy_file_range(sfd, dfd, n))
+    if hasattr(os, "sendfile"):
+        methods.append(lambda n: os.sendfile(dfd, sfd, None, n))
+    for copy in methods:
+        try:
+            while remaining:
+                n = copy(remaining)
+                if n == 0:
+                    break
+                remaining -= n
+        except OSError:
+            pass  # not supported for this platform/kernel/filesystem pair
+        if not remaining:
+            return 0
+    while remaining:
+        buf = os.read(sfd, min(remaining, 1 << 20))
+        if not buf:
+            break
+        view = memoryview(buf)
+        while view:
+            view = view[os.write(dfd, view):]
+        remaining -= len(buf)
+    return remaining
+
+def _copy_across(src: str, dst: str):
+    """
+    Copy src to dst (data, mode, timestamps) for a move across filesystems.
+    The data goes to a temp file next to dst that is os.replace()d onto it, so an
+    existing dst is only overwritten by a complete copy.
+    """
+    import tempfile
+    dst_dir, dst_name = os.path.split(dst)
+    # open src first: if it is unreadable or gone, no temp file (or fd) exists yet
+    with open(src, "rb") as s:
+        st = os.fstat(s.fileno())
+        fd, tmp = tempfile.mkstemp(prefix=f".{dst_name}.", suffix=".tmp", dir=dst_dir or None)
+        try:
+            with os.fdopen(fd, "wb") as d:
+                # quarantined files are empty: creating dst is the whole copy
+                if st.st_size and _copy_data(s.fileno(), d.fileno(), st.st_size):
+                    # never report success (and let _move unlink src) after a short copy
+                    raise OSError(errno.EIO, "short copy", src)
+            os.chmod(tmp, stat.S_IMODE(st.st_mode))
+            os.utime(tmp, ns=(st.st_atime_ns, st.st_mtime_ns))
+            os.replace(tmp, dst)
+        except BaseException:
+            try:
+                os.unlink(tmp)
+            except OSError:
+                pass
+            raise
 
-    if dry_run:
-        # Do not move; just return the would-be destination and metadata
+def _move(src: str, dst: str):
+    """Rename src to dst in one syscall; copy + unlink only when crossing filesystems."""
+    try:
+        os.replace(src, dst)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        _copy_across(src, dst)
+        os.unlink(src)
+
+def _make_mover(dst_dir: str, preserve_structure: bool, target_root: str, timestamp: str, verify: bool = False):
+    """
+    Build the per-file move function for one quarantine session. Flags, paths and the
+    os.path helpers are bound once here, so main()'s loop doesn't re-evaluate them per file.
+    The returned function takes an absolute src path (as yielded by iter_empty_files)
+    and returns (final_dest, metadata). Name collisions get a counter suffix; sizes are
+    recorded as 0 unless verify is True, in which case the moved file is stat()ed.
+    """
+    join = os.path.join
+    dirname = os.path.dirname
+    basename = os.path.basename
+    prefix = join(target_root, "")
+    cut = len(prefix)
+    made_dirs = {dst_dir}  # each destination directory is created once, not per file
+
+    # With preserve_structure, src keeps its path relative to target_root (files
+    # outside it fall back to their bare name); otherwise only the name is kept
+    if preserve_structure:
+        def dest_for(src):
+            return join(dst_dir, src[cut:] if src.startswith(prefix) else basename(src))
+    else:
+        def dest_for(src):
+            return join(dst_dir, basename(src))
+
+    def move(src: str):
+        dest_path = dest_for(src)
+        parent = dirname(dest_path)
+        if parent not in made_dirs:
+            os.makedirs(parent, exist_ok=True)
+            made_dirs.add(parent)
+        # The claimed placeholder is overwritten by the move itself
+        final_dest = _claim_unique_path(dest_path)
+        try:
+            _move(src, final_dest)
+        except BaseException:
+            # Drop the placeholder unless the move already went through (src gone),
+            # so no unrecorded 0-byte file is left behind, even on Ctrl-C
+            if os.path.lexists(src):
+                try:
+                    os.unlink(final_dest)
+                except OSError:
+                    pass
+            raise
         return final_dest, {
-            "original": str(src.resolve()),
-            "moved_to": str(final_dest.resolve()),
-            "size": src.stat().st_size if src.exists() else None,
-            "time": time.strftime("%Y-%m-%d %H:%M:%S"),
-            "action": "dry-run"
+            "original": src,
+            "moved_to": final_dest,
+            "size": os.stat(final_dest).st_size if verify else 0,
+            "time": timestamp,
+            "action": "moved"
         }
 
-    shutil.move(str(src), str(final_dest))
-    metadata = {
-        "original": str(src.resolve()),
-        "moved_to": str(final_dest.resolve()),
-        "size": final_dest.stat().st_size if final_dest.exists() else None,
-        "time": time.strftime("%Y-%m-%d %H:%M:%S"),
-        "action": "moved"
-    }
-    return final_dest, metadata
+    return move
 
-def write_metadata(quarantine_dir: Path, records: List[Dict]):
-    meta_file = quarantine_dir.joinpath("metadata.json")
-    # If metadata exists, append; else write fresh
-    existing = []
-    if meta_file.exists():
+class _SigintGuard:
+    """
+    SIGINT handler for the move loop: Ctrl-C raises KeyboardInterrupt right away,
+    except while `critical` is set (a file is being moved and recorded), where it is
+    held until check() so a moved file always gets its metadata record.
+    """
+    def __init__(self):
+        self.critical = False
+        self.pending = False
+        self._old = None
+
+    def _handle(self, signum, frame):
+        if self.critical:
+            self.pending = True
+        else:
+            raise KeyboardInterrupt
+
+    def install(self):
         try:
-            existing = json.loads(meta_file.read_text())
-        except Exception:
-            existing = []
-    existing.extend(records)
-    meta_file.write_text(json.dumps(existing, indent=2))
+            self._old = signal.signal(signal.SIGINT, self._handle)
+        except ValueError:
+            pass  # not the main thread: leave SIGINT handling alone
 
-def find_latest_quarantine(base: Path = None) -> Path:
-    base = Path(base) if base else Path.cwd()
-    candidates = [p for p in base.iterdir() if p.is_dir() and p.name.startswith("quarantine-")]
-    if not candidates:
-        return None
-    candidates.sort(key=lambda p: p.name, reverse=True)  # latest name usually has the newest timestamp
-    return candidates[0].resolve()
+    def uninstall(self):
+        if self._old is not None:
+            signal.signal(signal.SIGINT, self._old)
+            self._old = None
+
+    def check(self):
+        if self.pending:
+            self.pending = False
+            raise KeyboardInterrupt
 
-def restore_from_quarantine(quarantine_dir: Path, dry_run: bool = False, yes: bool = False):
-    meta_file = quarantine_dir.joinpath("metadata.json")
-    if not meta_file.exists():
-        print(f"No metadata.json found in {quarantine_dir}. Cannot restore reliably.")
+def write_metadata(quarantine_dir: Path, records: List[Dict]):
+    meta_file = quarantine_dir.joinpath(METADATA_FILE)
+    # One JSON record per line; appending never rewrites earlier records
+    with meta_file.open("ab") as f:
+        f.write(b"".join(_dumps(rec) for rec in records))
+
+def find_metadata_file(quarantine_dir: Path) -> Path:
+    """Return the quarantine's metadata file (metadata.jsonl, or a legacy metadata.json), or None."""
+    for name in (METADATA_FILE, LEGACY_METADATA_FILE):
+        meta_file = quarantine_dir.joinpath(name)
+        if meta_file.exists():
+            return meta_file
+    return None
+
+def _load_mapped(path: Path):
+    """Parse a whole JSON file from an mmap; orjson reads the mapping without a str/bytes copy."""
+    with open(path, "rb") as f:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            if orjson is not None:
+                try:
+                    with memoryview(mm) as view:
+                        return orjson.loads(view)
+                except orjson.JSONDecodeError:
+                    pass
+            return _json_loads(mm[:])
+
+def iter_metadata(meta_file: Path) -> Iterator[Dict]:
+    """Yield metadata records one at a time; JSONL files are never fully loaded."""
+    if meta_file.name == LEGACY_METADATA_FILE:
+        yield from _load_mapped(meta_file)
         return
+    with meta_file.open("rb") as f:
+        for line in f:
+            if line.strip():
+                yield _loads(line)
 
-    try:
-        records = json.loads(meta_file.read_text())
-    except Exception as e:
-        print(f"Failed to read metadata.json: {e}")
+def _quarantine_entries(base: Path):
+    """DirEntry objects for the quarantine-* directories directly under base."""
+    with os.scandir(base) as it:
+        return [e for e in it if e.name.startswith("quarantine-") and e.is_dir(follow_symlinks=False)]
+
+def find_latest_quarantine(base: Path = None) -> Path:
+    base = Path(base) if base else Path.cwd()
+    # latest name usually has the newest timestamp
+    newest = max(_quarantine_entries(base), key=lambda e: e.name, default=None)
+    return Path(newest.path).resolve() if newest else None
+
+def restore_from_quarantine(quarantine_dir: Path, dry_run: bool = False, yes: bool = False, verbose: bool = False):
+    """
+    Restore every record of quarantine_dir's metadata. Records are streamed, so only
+    skipped/failed entries are kept; restored files are counted, and listed if verbose
+    or for a dry-run, where the per-file plan is the point.
+    """
+    meta_file = find_metadata_file(quarantine_dir)
+    if meta_file is None:
+        print(f"No {METADATA_FILE} found in {quarantine_dir}. Cannot restore reliably.")
         return
 
-    restored = []
+    restored_count = 0
     skipped = []
     errors = []
 
-    for entry in records:
-        original = Path(entry.get("original"))
-        moved_to = Path(entry.get("moved_to"))
-        if not moved_to.exists():
-            skipped.append((original, moved_to, "moved file missing"))
-            continue
+    def restored(o, m):
+        nonlocal restored_count
+        restored_count += 1
+        if verbose or dry_run:
+            print(" - Restored:", o, "<-", m)
 
-        target_parent = original.parent
-        if not target_parent.exists():
-            try:
-                if not dry_run:
-                    target_parent.mkdir(parents=True, exist_ok=True)
-            except Exception as e:
-                errors.append((original, moved_to, f"failed to create parent: {e}"))
+    try:
+        for entry in iter_metadata(meta_file):
+            # Keep the recorded absolute paths as plain strings; no Path objects per record
+            original = entry.get("original")
+            moved_to = entry.get("moved_to")
+            if not os.path.exists(moved_to):
+                skipped.append((original, moved_to, "moved file missing"))
                 continue
 
-        # If original exists:
-        if original.exists():
-            if yes:
-                # overwrite
+            target_parent = os.path.dirname(original)
+            if not os.path.exists(target_parent):
                 try:
                     if not dry_run:
-                        # move to temp unique path then remove or overwrite
-                        tmp = _unique_path_if_exists(original)
-                        # prefer removing original then moving; if no permission, fallback to renaming
-                        original.unlink()
-                        shutil.move(str(moved_to), str(original))
-                        restored.append((original, moved_to))
-                    else:
-                        restored.append((original, moved_to))
+                        os.makedirs(target_parent, exist_ok=True)
                 except Exception as e:
-                    # try unique rename instead
+                    errors.append((original, moved_to, f"failed to create parent: {e}"))
+                    continue
+
+            # If original exists:
+            if os.path.exists(original):
+                if yes:
+                    # overwrite: os.replace swaps the file in atomically, no unlink first
                     try:
-                        candidate = _unique_path_if_exists(original)
                         if not dry_run:
-                            shutil.move(str(moved_to), str(candidate))
-                        restored.append((candidate, moved_to))
-                    except Exception as ee:
-                        errors.append((original, moved_to, f"overwrite error: {e}; fallback failed: {ee}"))
-                continue
-            else:
-                # do not overwrite; create unique name next to original
-                candidate = _unique_path_if_exists(original)
-                try:
-                    if not dry_run:
-                        shutil.move(str(moved_to), str(candidate))
-                    restored.append((candidate, moved_to))
-                except Exception as e:
-                    errors.append((original, moved_to, f"collision handling error: {e}"))
-                continue
+                            _move(moved_to, original)
+                        restored(original, moved_to)
+                    except OSError as e:
+                        errors.append((original, moved_to, f"overwrite error: {e}"))
+                    continue
+                else:
+                    # do not overwrite; create unique name next to original
+                    candidate = _unique_path_if_exists(original)
+                    try:
+                        if not dry_run:
+                            _move(moved_to, candidate)
+                        restored(candidate, moved_to)
+                    except Exception as e:
+                        errors.append((original, moved_to, f"collision handling error: {e}"))
+                    continue
 
-        # original does not exist, just move back
-        try:
-            if not dry_run:
-                shutil.move(str(moved_to), str(original))
-            restored.append((original, moved_to))
-        except Exception as e:
-            errors.append((original, moved_to, f"move error: {e}"))
+            # original does not exist, just move back
+            try:
+                if not dry_run:
+                    _move(moved_to, original)
+                restored(original, moved_to)
+            except Exception as e:
+                errors.append((original, moved_to, f"move error: {e}"))
+    except (OSError, ValueError) as e:
+        print(f"Failed to read {meta_file.name}: {e}")
 
     # summary output
     print(f"\nRestore Summary for: {quarantine_dir}")
-    print(f"Files restored/moved: {len(restored)}")
-    if restored:
-        for o, m in restored:
-            print(" - Restored:", o, "<-", m)
+    print(f"Files restored/moved: {restored_count}")
     if skipped:
         print(f"\nSkipped (missing moved file): {len(skipped)}")
-        for o, m, reason in skipped:
-            print(" - Skipped:", m, "->", o, "|", reason)
+        sys.stdout.write("".join(f" - Skipped: {m} -> {o} | {reason}\n" for o, m, reason in skipped))
     if errors:
         print(f"\nErrors: {len(errors)}")
-        for o, m, err in errors:
-            print(" - Error restoring", m, "->", o, ":", err)
+        sys.stdout.write("".join(f" - Error restoring {m} -> {o} : {err}\n" for o, m, err in errors))
 
 def list_quarantines(base: Path = None):
     base = Path(base) if base else Path.cwd()
-    quarantines = [p for p in base.iterdir() if p.is_dir() and p.name.startswith("quarantine-")]
-    quarantines.sort()
+    quarantines = sorted(Path(e.path) for e in _quarantine_entries(base))
     if not quarantines:
         print("No quarantine directories found in", base)
         return
     print("Quarantine directories:")
     for q in quarantines:
-        meta = q.joinpath("metadata.json")
+        meta = find_metadata_file(q)
         count = "?" 
-        if meta.exists():
+        if meta is not None:
             try:
-                arr = json.loads(meta.read_text())
-                count = len(arr)
+                count = sum(1 for _ in iter_metadata(meta))
             except Exception:
                 count = "?"
         print(f" - {q}  (items recorded: {count})")
 
 def main():
+    # Imported here so library use and the scan itself don't pay for argparse
+    import argparse
+
     parser = argparse.ArgumentParser(description="Move empty files to a quarantine folder (safe).")
     parser.add_argument("target", nargs="?", default=".", help="Target directory to scan")
     parser.add_argument("--no-recursive", dest="recursive", action="store_false", help="Do not search recursively")
@@ -221,8 +579,14 @@ def main():
     parser.add_argument("--ignore-hidden", dest="ignore_hidden", action="store_true", help="Ignore hidden files/dirs (default)")
     parser.add_argument("--include-hidden", dest="ignore_hidden", action="store_false", help="Include hidden files/dirs")
     parser.add_argument("--restore", action="store_true", help="Restore files from a quarantine (uses --quarantine or finds latest in cwd)")
+    parser.add_argument("--workers", type=int, default=min(8, (os.cpu_count() or 1) * 2), help="Number of threads used to scan the target (1 = serial scan)")
+    parser.add_argument("--limit", type=int, help="Stop after finding this many empty files")
+    parser.add_argument("--verify", action="store_true", help="stat() each moved file to record its real size in metadata")
+    parser.add_argument("--verbose", action="store_true", help="List every restored file, not just the totals")
     parser.add_argument("--list-quarantines", action="store_true", help="List quarantine folders in current directory")
     args = parser.parse_args()
+    if args.limit is not None and args.limit < 0:
+        parser.error("--limit must be a non-negative integer")
 
     target = Path(args.target).resolve()
     if not args.restore:
@@ -231,18 +595,31 @@ def main():
             print(f"Target directory does not exist or is not a directory: {target}")
             sys.exit(1)
 
-        empty_files = find_empty_files(target, recursive=args.recursive, ignore_hidden=args.ignore_hidden)
-        if not empty_files:
-            print("No empty files found.")
-            return
+        empty_files = iter_empty_files(target, recursive=args.recursive, ignore_hidden=args.ignore_hidden, workers=args.workers)
+        if args.limit is not None:
+            empty_files = itertools.islice(empty_files, args.limit)
 
-        print("Empty files found:")
-        for f in empty_files:
-            print(" -", f)
+        # With --yes there is nothing to confirm, so files are moved while the scan is still running
+        stream = args.yes and not args.dry_run
+        if stream:
+            first = next(empty_files, None)
+            if first is None:
+                print("No empty files found.")
+                return
+            empty_files = itertools.chain([first], empty_files)
+        else:
+            empty_files = list(empty_files)
+            if not empty_files:
+                print("No empty files found.")
+                return
 
-        if args.dry_run:
-            print("\nDry-run: no files were moved.")
-            return
+            print("Empty files found:")
+            # One write for the whole list instead of a print() per file
+            sys.stdout.write("".join(f" - {f}\n" for f in empty_files))
+
+            if args.dry_run:
+                print("\nDry-run: no files were moved.")
+                return
 
         quarantine_base = Path(args.quarantine) if args.quarantine else None
         quarantine_dir = make_quarantine_dir(quarantine_base)
@@ -254,24 +631,50 @@ def main():
                 print("Aborted by user.")
                 return
 
+        qdir_str = os.fspath(quarantine_dir)
+        qdir_prefix = os.path.join(qdir_str, "")
+        session_ts = time.strftime("%Y-%m-%d %H:%M:%S")
+        mover = _make_mover(qdir_str, args.preserve_structure, os.fspath(target), session_ts, verify=args.verify)
         moved_meta = []
-        for src in empty_files:
-            try:
-                dest, meta = safe_move(src, quarantine_dir, preserve_structure=args.preserve_structure, target_root=target, dry_run=False)
-                moved_meta.append(meta)
-                print(f"[MOVED] {src} -> {dest}")
-            except Exception as e:
-                print(f"[ERROR] Could not move {src}: {e}")
-
-        if moved_meta:
-            try:
-                write_metadata(quarantine_dir, moved_meta)
-            except Exception as e:
-                print(f"Warning: failed to write metadata.json: {e}")
+        moved_count = 0
+        guard = _SigintGuard()
+        guard.install()
+        try:
+            for src in empty_files:
+                if src.startswith(qdir_prefix):
+                    # a streaming scan of the target can reach the quarantine being filled
+                    continue
+                # Ctrl-C is held off between the move and its metadata append
+                guard.critical = True
+                try:
+                    dest, meta = mover(src)
+                    moved_meta.append(meta)
+                    moved_count += 1
+                    print(f"[MOVED] {src} -> {dest}")
+                except Exception as e:
+                    print(f"[ERROR] Could not move {src}: {e}")
+                finally:
+                    guard.critical = False
+                guard.check()
+                if len(moved_meta) >= _METADATA_FLUSH:
+                    try:
+                        write_metadata(quarantine_dir, moved_meta)
+                    except Exception as e:
+                        print(f"Warning: failed to write {METADATA_FILE}: {e}")
+                    moved_meta = []
+        finally:
+            guard.uninstall()
+            # also on Ctrl-C mid-scan; with the guard above, every moved file has a
+            # record here (a hard kill or crash can still lose the unflushed batch)
+            if moved_meta:
+                try:
+                    write_metadata(quarantine_dir, moved_meta)
+                except Exception as e:
+                    print(f"Warning: failed to write {METADATA_FILE}: {e}")
 
         print("\nSummary:")
-        print(f"Files moved: {len(moved_meta)}")
-        if moved_meta:
+        print(f"Files moved: {moved_count}")
+        if moved_count:
             print(f"Quarantine location: {quarantine_dir}")
         else:
             print("No files were moved.")
@@ -302,7 +705,7 @@ def main():
                 print("Aborted by user.")
                 return
 
-        restore_from_quarantine(qdir, dry_run=args.dry_run, yes=args.yes)
+        restore_from_quarantine(qdir, dry_run=args.dry_run, yes=args.yes, verbose=args.verbose)
 
 if __name__ == "__main__":
     main()